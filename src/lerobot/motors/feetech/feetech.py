@@ -231,6 +231,12 @@ class FeetechMotorsBus(MotorsBus):
 
     @property
     def is_calibrated(self) -> bool:
+        # Checking reads the calibration registers of every motor, so the result is kept until it may change.
+        if self._is_calibrated_cache is None:
+            self._is_calibrated_cache = self._read_is_calibrated()
+        return self._is_calibrated_cache
+
+    def _read_is_calibrated(self) -> bool:
         motors_calibration = self.read_calibration()
         if set(motors_calibration) != set(self.calibration):
             return False
@@ -279,6 +285,7 @@ class FeetechMotorsBus(MotorsBus):
 
         if cache:
             self.calibration = calibration_dict
+        self.invalidate_calibration_cache()
 
     def _get_half_turn_homings(self, positions: dict[NameOrID, Value]) -> dict[NameOrID, Value]:
         """
@@ -21,6 +21,7 @@
 
 import abc
 import logging
+import sys
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
@@ -28,8 +29,8 @@ from functools import cached_property
 from pprint import pformat
 from typing import Protocol, TypeAlias
 
+import numpy as np
 import serial
-from deepdiff import DeepDiff
 from tqdm import tqdm
 
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
@@ -38,6 +39,9 @@ from lerobot.utils.utils import enter_pressed, move_cursor_up
 NameOrID: TypeAlias = str | int
 Value: TypeAlias = int | float
 
+# Number of distinct motor selections for which `sync_read` keeps the resolved ids and models around.
+SYNC_READ_TARGETS_CACHE_SIZE = 8
+
 logger = logging.getLogger(__name__)
 
 
@@ -83,7 +87,7 @@ class MotorNormMode(str, Enum):
     DEGREES = "degrees"
 
 
-@dataclass
+@dataclass(slots=True)
 class MotorCalibration:
     id: int
     drive_mode: int
@@ -92,7 +96,7 @@ class MotorCalibration:
     range_max: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Motor:
     id: int
     model: str
@@ -261,8 +265,11 @@ class MotorsBus(abc.ABC):
         calibration: dict[str, MotorCalibration] | None = None,
     ):
         self.port = port
-        self.motors = motors
+        # Interned names let the per-motor dict lookups on the read/write paths resolve by identity, even when
+        # names were built dynamically (e.g. prefixed) rather than written as literals.
+        self.motors = {sys.intern(name): motor for name, motor in motors.items()}
         self.calibration = calibration if calibration else {}
+        self._is_calibrated_cache: bool | None = None
 
         self.port_handler: PortHandler
         self.packet_handler: PacketHandler
@@ -274,6 +281,7 @@ class MotorsBus(abc.ABC):
         self._id_to_model_dict = {m.id: m.model for m in self.motors.values()}
         self._id_to_name_dict = {m.id: motor for motor, m in self.motors.items()}
         self._model_nb_to_model_dict = {v: k for k, v in self.model_number_table.items()}
+        self._sync_read_targets: dict[tuple[str, ...], tuple[list[int], list[str]]] = {}
 
         self._validate_motors()
 
@@ -294,9 +302,7 @@ class MotorsBus(abc.ABC):
             return False
 
         first_table = self.model_ctrl_table[self.models[0]]
-        return any(
-            DeepDiff(first_table, get_ctrl_table(self.model_ctrl_table, model)) for model in self.models[1:]
-        )
+        return any(first_table != get_ctrl_table(self.model_ctrl_table, model) for model in self.models[1:])
 
     @cached_property
     def models(self) -> list[str]:
@@ -341,11 +347,34 @@ class MotorsBus(abc.ABC):
         else:
             raise TypeError(motors)
 
+    def _get_sync_read_targets(self, motors: str | list[str] | None) -> tuple[list[int], list[str]]:
+        """Resolve `motors` into (ids, models), memoizing the result since control loops read the same
+        selection of motors at every step. The returned lists are shared and must not be mutated."""
+        if motors is None:
+            return self.ids, self.models
+        elif isinstance(motors, str):
+            key = (motors,)
+        elif isinstance(motors, list):
+            key = tuple(motors)
+        else:
+            raise TypeError(motors)
+
+        targets = self._sync_read_targets.get(key)
+        if targets is None:
+            targets = ([self.motors[motor].id for motor in key], [self.motors[motor].model for motor in key])
+            if len(self._sync_read_targets) >= SYNC_READ_TARGETS_CACHE_SIZE:
+                self._sync_read_targets.pop(next(iter(self._sync_read_targets)))
+            self._sync_read_targets[key] = targets
+
+        return targets
+
     def _get_ids_values_dict(self, values: Value | dict[str, Value] | None) -> list[str]:
-        if isinstance(values, (int | float)):
+        # Per-motor dicts are what control loops send at every step, so check for them first.
+        if isinstance(values, dict):
+            motors = self.motors
+            return {motors[motor].id: val for motor, val in values.items()}
+        elif isinstance(values, (int | float)):
             return dict.fromkeys(self.ids, values)
-        elif isinstance(values, dict):
-            return {self.motors[motor].id: val for motor, val in values.items()}
         else:
             raise TypeError(f"'values' is expected to be a single value or a dict. Got {values}")
 
@@ -429,6 +458,7 @@ class MotorsBus(abc.ABC):
 
         self._connect(handshake)
         self.set_timeout()
+        self.invalidate_calibration_cache()
         logger.debug(f"{self.__class__.__name__} connected.")
 
     def _connect(self, handshake: bool = True) -> None:
@@ -466,6 +496,7 @@ class MotorsBus(abc.ABC):
             self.disable_torque(num_retry=5)
 
         self.port_handler.closePort()
+        self.invalidate_calibration_cache()
         logger.debug(f"{self.__class__.__name__} disconnected.")
 
     @classmethod
@@ -536,6 +567,7 @@ class MotorsBus(abc.ABC):
         self._write(addr, length, target_id, baudrate_value)
 
         self.set_baudrate(self.default_baudrate)
+        self.invalidate_calibration_cache()
 
     @abc.abstractmethod
     def _find_single_motor(self, motor: str, initial_baudrate: int | None) -> tuple[int, int]:
@@ -637,6 +669,14 @@ class MotorsBus(abc.ABC):
         """bool: ``True`` if the cached calibration matches the motors."""
         pass
 
+    def invalidate_calibration_cache(self) -> None:
+        """Forget the memoized result of :pyattr:`is_calibrated`.
+
+        The bus already does this whenever it connects, disconnects or writes/resets calibration. Call it
+        after changing calibration registers by other means (e.g. raw :pymeth:`write` calls).
+        """
+        self._is_calibrated_cache = None
+
     @abc.abstractmethod
     def read_calibration(self) -> dict[str, MotorCalibration]:
         """Read calibration parameters from the motors.
@@ -682,6 +722,7 @@ class MotorsBus(abc.ABC):
             self.write("Max_Position_Limit", motor, max_res, normalize=False)
 
         self.calibration = {}
+        self.invalidate_calibration_cache()
 
     def set_half_turn_homings(self, motors: NameOrID | list[NameOrID] | None = None) -> dict[NameOrID, Value]:
         """Centre each motor range around its current position.
@@ -771,25 +812,30 @@ class MotorsBus(abc.ABC):
         if not self.calibration:
             raise RuntimeError(f"{self} has no calibration registered.")
 
+        id_to_name = self._id_to_name_dict
+        calibration = self.calibration
+        motors = self.motors
         normalized_values = {}
         for id_, val in ids_values.items():
-            motor = self._id_to_name(id_)
-            min_ = self.calibration[motor].range_min
-            max_ = self.calibration[motor].range_max
-            drive_mode = self.apply_drive_mode and self.calibration[motor].drive_mode
+            motor = id_to_name[id_]
+            calib = calibration[motor]
+            min_ = calib.range_min
+            max_ = calib.range_max
+            drive_mode = self.apply_drive_mode and calib.drive_mode
             if max_ == min_:
                 raise ValueError(f"Invalid calibration for motor '{motor}': min and max are equal.")
 
             bounded_val = min(max_, max(min_, val))
-            if self.motors[motor].norm_mode is MotorNormMode.RANGE_M100_100:
+            norm_mode = motors[motor].norm_mode
+            if norm_mode is MotorNormMode.RANGE_M100_100:
                 norm = (((bounded_val - min_) / (max_ - min_)) * 200) - 100
                 normalized_values[id_] = -norm if drive_mode else norm
-            elif self.motors[motor].norm_mode is MotorNormMode.RANGE_0_100:
+            elif norm_mode is MotorNormMode.RANGE_0_100:
                 norm = ((bounded_val - min_) / (max_ - min_)) * 100
                 normalized_values[id_] = 100 - norm if drive_mode else norm
-            elif self.motors[motor].norm_mode is MotorNormMode.DEGREES:
+            elif norm_mode is MotorNormMode.DEGREES:
                 mid = (min_ + max_) / 2
-                max_res = self.model_resolution_table[self._id_to_model(id_)] - 1
+                max_res = self.model_resolution_table[self._id_to_model_dict[id_]] - 1
                 normalized_values[id_] = (val - mid) * 360 / max_res
             else:
                 raise NotImplementedError
@@ -800,26 +846,31 @@ class MotorsBus(abc.ABC):
         if not self.calibration:
             raise RuntimeError(f"{self} has no calibration registered.")
 
+        id_to_name = self._id_to_name_dict
+        calibration = self.calibration
+        motors = self.motors
         unnormalized_values = {}
         for id_, val in ids_values.items():
-            motor = self._id_to_name(id_)
-            min_ = self.calibration[motor].range_min
-            max_ = self.calibration[motor].range_max
-            drive_mode = self.apply_drive_mode and self.calibration[motor].drive_mode
+            motor = id_to_name[id_]
+            calib = calibration[motor]
+            min_ = calib.range_min
+            max_ = calib.range_max
+            drive_mode = self.apply_drive_mode and calib.drive_mode
             if max_ == min_:
                 raise ValueError(f"Invalid calibration for motor '{motor}': min and max are equal.")
 
-            if self.motors[motor].norm_mode is MotorNormMode.RANGE_M100_100:
+            norm_mode = motors[motor].norm_mode
+            if norm_mode is MotorNormMode.RANGE_M100_100:
                 val = -val if drive_mode else val
                 bounded_val = min(100.0, max(-100.0, val))
                 unnormalized_values[id_] = int(((bounded_val + 100) / 200) * (max_ - min_) + min_)
-            elif self.motors[motor].norm_mode is MotorNormMode.RANGE_0_100:
+            elif norm_mode is MotorNormMode.RANGE_0_100:
                 val = 100 - val if drive_mode else val
                 bounded_val = min(100.0, max(0.0, val))
                 unnormalized_values[id_] = int((bounded_val / 100) * (max_ - min_) + min_)
-            elif self.motors[motor].norm_mode is MotorNormMode.DEGREES:
+            elif norm_mode is MotorNormMode.DEGREES:
                 mid = (min_ + max_) / 2
-                max_res = self.model_resolution_table[self._id_to_model(id_)] - 1
+                max_res = self.model_resolution_table[self._id_to_model_dict[id_]] - 1
                 unnormalized_values[id_] = int((val * max_res / 360) + mid)
             else:
                 raise NotImplementedError
@@ -1063,6 +1114,50 @@ class MotorsBus(abc.ABC):
         Returns:
             dict[str, Value]: Mapping *motor name → value*.
         """
+        ids_values = self._sync_read_ids_values(data_name, motors, normalize=normalize, num_retry=num_retry)
+        id_to_name = self._id_to_name_dict
+        return {id_to_name[id_]: value for id_, value in ids_values.items()}
+
+    def sync_read_array(
+        self,
+        data_name: str,
+        motors: str | list[str] | None = None,
+        *,
+        out: np.ndarray | None = None,
+        normalize: bool = True,
+        num_retry: int = 0,
+    ) -> np.ndarray:
+        """Same as :pymeth:`sync_read` but return the values as an array instead of a dict.
+
+        Values are ordered like *motors* (or like :pyattr:`motors` when `None`), which avoids building a
+        name-keyed dict when the caller only needs a vector (e.g. to feed a policy).
+
+        Args:
+            data_name (str): Register name.
+            motors (str | list[str] | None, optional): Motors to query. `None` (default) reads every motor.
+            out (np.ndarray | None, optional): 1D array to write the values into, so that it can be reused
+                across calls. A new `float64` array is allocated when `None` (default).
+            normalize (bool, optional): Normalisation flag.  Defaults to `True`.
+            num_retry (int, optional): Retry attempts.  Defaults to `0`.
+
+        Returns:
+            np.ndarray: *out*, filled with one value per motor.
+        """
+        ids, _ = self._get_sync_read_targets(motors)
+        if out is None:
+            out = np.empty(len(ids), dtype=np.float64)
+        elif out.shape != (len(ids),):
+            raise ValueError(f"'out' should have shape {(len(ids),)}. Got {out.shape}.")
+
+        ids_values = self._sync_read_ids_values(data_name, motors, normalize=normalize, num_retry=num_retry)
+        for i, id_ in enumerate(ids):
+            out[i] = ids_values[id_]
+
+        return out
+
+    def _sync_read_ids_values(
+        self, data_name: str, motors: str | list[str] | None, *, normalize: bool, num_retry: int
+    ) -> dict[int, Value]:
         if not self.is_connected:
             raise DeviceNotConnectedError(
                 f"{self.__class__.__name__}('{self.port}') is not connected. You need to run `{self.__class__.__name__}.connect()`."
@@ -1070,9 +1165,7 @@ class MotorsBus(abc.ABC):
 
         self._assert_protocol_is_compatible("sync_read")
 
-        names = self._get_motors_list(motors)
-        ids = [self.motors[motor].id for motor in names]
-        models = [self.motors[motor].model for motor in names]
+        ids, models = self._get_sync_read_targets(motors)
 
         if self._has_different_ctrl_tables:
             assert_same_address(self.model_ctrl_table, models, data_name)
@@ -1090,7 +1183,7 @@ class MotorsBus(abc.ABC):
         if normalize and data_name in self.normalized_data:
             ids_values = self._normalize(ids_values)
 
-        return {self._id_to_name(id_): value for id_, value in ids_values.items()}
+        return ids_values
 
     def _sync_read(
         self,
@@ -1115,15 +1208,17 @@ class MotorsBus(abc.ABC):
         if not self._is_comm_success(comm) and raise_on_error:
             raise ConnectionError(f"{err_msg} {self.packet_handler.getTxRxResult(comm)}")
 
-        values = {id_: self.sync_reader.getData(id_, addr, length) for id_ in motor_ids}
+        get_data = self.sync_reader.getData
+        values = {id_: get_data(id_, addr, length) for id_ in motor_ids}
         return values, comm
 
     def _setup_sync_reader(self, motor_ids: list[int], addr: int, length: int) -> None:
-        self.sync_reader.clearParam()
-        self.sync_reader.start_address = addr
-        self.sync_reader.data_length = length
+        sync_reader = self.sync_reader
+        sync_reader.clearParam()
+        sync_reader.start_address = addr
+        sync_reader.data_length = length
         for id_ in motor_ids:
-            self.sync_reader.addParam(id_)
+            sync_reader.addParam(id_)
 
     # TODO(aliberts, pkooij): Implementing something like this could get even much faster read times if need be.
     # Would have to handle the logic of checking if a packet has been sent previously though but doable.
@@ -1166,11 +1261,11 @@ class MotorsBus(abc.ABC):
             )
 
         ids_values = self._get_ids_values_dict(values)
-        models = [self._id_to_model(id_) for id_ in ids_values]
         if self._has_different_ctrl_tables:
+            models = [self._id_to_model(id_) for id_ in ids_values]
             assert_same_address(self.model_ctrl_table, models, data_name)
 
-        model = next(iter(models))
+        model = self._id_to_model_dict[next(iter(ids_values))]
         addr, length = get_address(self.model_ctrl_table, model, data_name)
 
         if normalize and data_name in self.normalized_data:
@@ -1206,9 +1301,10 @@ class MotorsBus(abc.ABC):
         return comm
 
     def _setup_sync_writer(self, ids_values: dict[int, int], addr: int, length: int) -> None:
-        self.sync_writer.clearParam()
-        self.sync_writer.start_address = addr
-        self.sync_writer.data_length = length
+        sync_writer = self.sync_writer
+        sync_writer.clearParam()
+        sync_writer.start_address = addr
+        sync_writer.data_length = length
         for id_, value in ids_values.items():
             data = self._serialize_data(value, length)
-            self.sync_writer.addParam(id_, data)
+            sync_writer.addParam(id_, data)
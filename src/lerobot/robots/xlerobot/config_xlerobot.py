@@ -19,6 +19,7 @@
 #   https://github.com/bingogome/lerobot
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
 from lerobot.cameras import CameraConfig
@@ -45,54 +46,51 @@ class XLeRobotConfig(RobotConfig):
     def __post_init__(self) -> None:
         super().__post_init__()
 
-        arms_cfg: BiSO101FollowerConfig | None = None
+        # Sub-configs are only built when first accessed (see `arms_config`, `base_config`, `mount_config`),
+        # so tools that only inspect e.g. `cameras` don't pay for instantiating them.
+        if self.base:
+            self.base_type = self.base_type or self.BASE_TYPE_LEKIWI
+            if self.base_type not in (self.BASE_TYPE_LEKIWI, self.BASE_TYPE_BIWHEEL):
+                raise ValueError(f"Unsupported XLeRobot base type: {self.base_type}")
+        else:
+            self.base_type = None
+
+    def _inherit_defaults(self, cfg: RobotConfig, suffix: str) -> None:
+        if self.id and getattr(cfg, "id", None) is None:
+            cfg.id = f"{self.id}_{suffix}"
+        if self.calibration_dir and getattr(cfg, "calibration_dir", None) is None:
+            cfg.calibration_dir = self.calibration_dir
+
+    @cached_property
+    def arms_config(self) -> BiSO101FollowerConfig | None:
         if isinstance(self.arms, BiSO101FollowerConfig):
             arms_cfg = self.arms
         elif self.arms:
             arms_cfg = BiSO101FollowerConfig(**self.arms)
-
-        base_cfg: LeKiwiBaseConfig | BiWheelBaseConfig | None = None
-        base_type = self.base_type or self.BASE_TYPE_LEKIWI
-        if self.base:
-            if base_type == self.BASE_TYPE_LEKIWI:
-                base_cfg = (
-                    self.base if isinstance(self.base, LeKiwiBaseConfig) else LeKiwiBaseConfig(**self.base)
-                )
-            elif base_type == self.BASE_TYPE_BIWHEEL:
-                base_cfg = (
-                    self.base if isinstance(self.base, BiWheelBaseConfig) else BiWheelBaseConfig(**self.base)
-                )
-            else:
-                raise ValueError(f"Unsupported XLeRobot base type: {base_type}")
         else:
-            base_type = None
+            return None
+
+        self._inherit_defaults(arms_cfg, "arms")
+        return arms_cfg
+
+    @cached_property
+    def base_config(self) -> LeKiwiBaseConfig | BiWheelBaseConfig | None:
+        if not self.base:
+            return None
 
-        mount_cfg: XLeRobotMountConfig | None = None
+        config_cls = LeKiwiBaseConfig if self.base_type == self.BASE_TYPE_LEKIWI else BiWheelBaseConfig
+        base_cfg = self.base if isinstance(self.base, config_cls) else config_cls(**self.base)
+        self._inherit_defaults(base_cfg, "base")
+        return base_cfg
+
+    @cached_property
+    def mount_config(self) -> XLeRobotMountConfig | None:
         if isinstance(self.mount, XLeRobotMountConfig):
             mount_cfg = self.mount
         elif self.mount:
             mount_cfg = XLeRobotMountConfig(**self.mount)
+        else:
+            return None
 
-        self.arms = arms_cfg
-        self.base = base_cfg
-        self.mount = mount_cfg
-        self.arms_config: BiSO101FollowerConfig | None = arms_cfg
-        self.base_config: LeKiwiBaseConfig | BiWheelBaseConfig | None = base_cfg
-        self.mount_config: XLeRobotMountConfig | None = mount_cfg
-        self.base_type = base_type
-
-        if self.id:
-            if arms_cfg and arms_cfg.id is None:
-                arms_cfg.id = f"{self.id}_arms"
-            if base_cfg and getattr(base_cfg, "id", None) is None:
-                base_cfg.id = f"{self.id}_base"
-            if mount_cfg and mount_cfg.id is None:
-                mount_cfg.id = f"{self.id}_mount"
-
-        if self.calibration_dir:
-            if arms_cfg and arms_cfg.calibration_dir is None:
-                arms_cfg.calibration_dir = self.calibration_dir
-            if base_cfg and getattr(base_cfg, "calibration_dir", None) is None:
-                base_cfg.calibration_dir = self.calibration_dir
-            if mount_cfg and mount_cfg.calibration_dir is None:
-                mount_cfg.calibration_dir = self.calibration_dir
+        self._inherit_defaults(mount_cfg, "mount")
+        return mount_cfg
@@ -21,8 +21,11 @@
 #   https://github.com/bingogome/lerobot
 
 import logging
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import replace
 from functools import cached_property
+from types import MappingProxyType
 from typing import Any
 
 import numpy as np
@@ -39,6 +42,13 @@ from .config_xlerobot import XLeRobotConfig
 
 logger = logging.getLogger(__name__)
 
+_BASE_ROBOT_CLASSES: Mapping[str, type[Robot]] = MappingProxyType(
+    {
+        XLeRobotConfig.BASE_TYPE_LEKIWI: LeKiwiBase,
+        XLeRobotConfig.BASE_TYPE_BIWHEEL: BiWheelBase,
+    }
+)
+
 
 class XLeRobot(Robot):
     """Combined platform: bimanual SO-101 follower arms mounted on a configurable mobile base."""
@@ -60,15 +70,15 @@ class XLeRobot(Robot):
         }
 
     def _build_base_robot(self) -> Robot | None:
-        base_config = getattr(self.config, "base_config", None)
+        base_config = self.config.base_config
         if base_config is None:
             return None
-        base_type = getattr(self.config, "base_type", None) or XLeRobotConfig.BASE_TYPE_LEKIWI
-        if base_type == XLeRobotConfig.BASE_TYPE_LEKIWI:
-            return LeKiwiBase(replace(base_config))
-        if base_type == XLeRobotConfig.BASE_TYPE_BIWHEEL:
-            return BiWheelBase(replace(base_config))
-        raise ValueError(f"Unsupported base robot type: {base_type}")
+        base_type = self.config.base_type or XLeRobotConfig.BASE_TYPE_LEKIWI
+        try:
+            base_cls = _BASE_ROBOT_CLASSES[base_type]
+        except KeyError:
+            raise ValueError(f"Unsupported base robot type: {base_type}") from None
+        return base_cls(replace(base_config))
 
     def _make_blank_camera_obs(self, cam_key: str) -> np.ndarray:
         cam_config = self.camera_configs.get(cam_key)
@@ -124,8 +134,17 @@ class XLeRobot(Robot):
             self.base.connect(calibrate=calibrate, handshake=handshake)
         if self.arms:
             self.arms.connect(calibrate=calibrate)
-        for cam in self.cameras.values():
-            cam.connect()
+        self._connect_cameras()
+
+    def _connect_cameras(self) -> None:
+        # Opening a camera is dominated by waiting on the device, so cameras are connected concurrently.
+        # Motor components above stay sequential since their calibration may prompt the user.
+        if not self.cameras:
+            return
+        with ThreadPoolExecutor(max_workers=len(self.cameras)) as executor:
+            futures = [executor.submit(cam.connect) for cam in self.cameras.values()]
+            for future in futures:
+                future.result()
 
     @property
     def is_calibrated(self) -> bool:
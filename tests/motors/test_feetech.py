@@ -367,6 +367,23 @@ def test_is_calibrated(mock_motors, dummy_motors, dummy_calibration):
     assert all(mock_motors.stubs[stub].called for stub in homings_stubs)
 
 
+def test_is_calibrated_is_cached(mock_motors, dummy_motors, dummy_calibration):
+    bus = FeetechMotorsBus(
+        port=mock_motors.port,
+        motors=dummy_motors,
+        calibration=dummy_calibration,
+    )
+
+    with patch.object(FeetechMotorsBus, "read_calibration", return_value=dummy_calibration) as mock_read:
+        assert bus.is_calibrated
+        assert bus.is_calibrated
+        assert mock_read.call_count == 1
+
+        bus.invalidate_calibration_cache()
+        assert bus.is_calibrated
+        assert mock_read.call_count == 2
+
+
 def test_reset_calibration(mock_motors, dummy_motors):
     write_homing_stubs = []
     write_mins_stubs = []
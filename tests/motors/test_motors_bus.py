@@ -17,9 +17,11 @@
 import re
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from lerobot.motors.motors_bus import (
+    SYNC_READ_TARGETS_CACHE_SIZE,
     Motor,
     MotorNormMode,
     assert_same_address,
@@ -109,6 +111,29 @@ def test__serialize_data_large_number():
         bus._serialize_data(2**32, 4)  # 4-byte max is 0xFFFFFFFF
 
 
+def test__get_sync_read_targets(dummy_motors):
+    bus = MockMotorsBus("/dev/dummy-port", dummy_motors)
+
+    ids, models = bus._get_sync_read_targets(["dummy_3", "dummy_1"])
+    assert ids == [3, 1]
+    assert models == ["model_2", "model_2"]
+    assert bus._get_sync_read_targets(["dummy_3", "dummy_1"])[0] is ids
+    assert bus._get_sync_read_targets("dummy_2") == ([2], ["model_3"])
+    assert bus._get_sync_read_targets(None) == (bus.ids, bus.models)
+
+
+def test__get_sync_read_targets_cache_is_bounded(dummy_motors):
+    bus = MockMotorsBus("/dev/dummy-port", dummy_motors)
+    selections = [["dummy_1"] * n for n in range(1, SYNC_READ_TARGETS_CACHE_SIZE + 2)]
+
+    for motors in selections:
+        bus._get_sync_read_targets(motors)
+
+    assert len(bus._sync_read_targets) == SYNC_READ_TARGETS_CACHE_SIZE
+    assert tuple(selections[0]) not in bus._sync_read_targets
+    assert tuple(selections[-1]) in bus._sync_read_targets
+
+
 @pytest.mark.parametrize(
     "data_name, id_, value",
     [
@@ -289,6 +314,30 @@ def test_sync_read_by_none(data_name, ids_values, dummy_motors):
         mock__normalize.assert_called_once_with(ids_values)
 
 
+def test_sync_read_array(dummy_motors):
+    bus = MockMotorsBus("/dev/dummy-port", dummy_motors)
+    bus.connect(handshake=False)
+    ids_values = {3: 4016, 1: 1337}
+    out = np.zeros(2)
+
+    with (
+        patch.object(MockMotorsBus, "_sync_read", return_value=(ids_values, 0)),
+        patch.object(MockMotorsBus, "_decode_sign", return_value=ids_values),
+    ):
+        returned_array = bus.sync_read_array("Present_Velocity", ["dummy_3", "dummy_1"], out=out)
+
+    assert returned_array is out
+    np.testing.assert_array_equal(out, [4016, 1337])
+
+
+def test_sync_read_array_wrong_out_shape(dummy_motors):
+    bus = MockMotorsBus("/dev/dummy-port", dummy_motors)
+    bus.connect(handshake=False)
+
+    with pytest.raises(ValueError, match=re.escape("'out' should have shape (3,)")):
+        bus.sync_read_array("Present_Velocity", out=np.zeros(2))
+
+
 @pytest.mark.parametrize(
     "data_name, value",
     [